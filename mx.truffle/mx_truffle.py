@@ -26,6 +26,10 @@
 #
 # ----------------------------------------------------------------------------------------------------
 
+import shutil
+import tempfile
+from os.path import basename, join, splitext
+
 import mx
 
 from mx_unittest import unittest
@@ -40,20 +44,93 @@ def build(args, vm=None):
     opts2 = mx.build(['--source', '1.7'] + args)
     assert len(opts2.remainder) == 0
 
+_classpath_cache = {}
+
+def _classpath(names):
+    """memoizing wrapper for mx.classpath, which walks the dependency graph on every call"""
+    key = tuple(names) if isinstance(names, list) else names
+    cp = _classpath_cache.get(key)
+    if cp is None:
+        cp = mx.classpath(names)
+        _classpath_cache[key] = cp
+    return cp
+
 def sl(args):
     """run an SL program"""
     vmArgs, slArgs = mx.extract_VM_args(args)
-    mx.run_java(vmArgs + ['-cp', mx.classpath(["TRUFFLE_API", "com.oracle.truffle.sl"]), "com.oracle.truffle.sl.SLLanguage"] + slArgs)
+    mx.run_java(vmArgs + ['-cp', _classpath(["TRUFFLE_API", "com.oracle.truffle.sl"]), "com.oracle.truffle.sl.SLLanguage"] + slArgs)
 
 def slcoverage(args):
     """Demo: run an SL program with coverage counts printed when done"""
     vmArgs, slArgs = mx.extract_VM_args(args)
-    mx.run_java(vmArgs + ['-cp', mx.classpath("com.oracle.truffle.sl.tools"), "com.oracle.truffle.sl.tools.SLCoverage"] + slArgs)
+    mx.run_java(vmArgs + ['-cp', _classpath("com.oracle.truffle.sl.tools"), "com.oracle.truffle.sl.tools.SLCoverage"] + slArgs)
 
 def sldebug(args):
     """run a simple command line debugger for the Simple Language"""
     vmArgs, slArgs = mx.extract_VM_args(args, useDoubleDash=True)
-    mx.run_java(vmArgs + ['-cp', mx.classpath("com.oracle.truffle.sl.tools"), "com.oracle.truffle.sl.tools.debug.SLREPL"] + slArgs)
+    mx.run_java(vmArgs + ['-cp', _classpath("com.oracle.truffle.sl.tools"), "com.oracle.truffle.sl.tools.debug.SLREPL"] + slArgs)
+
+_MAVEN_POM_HEADER = """<?xml version="1.0" encoding="UTF-8"?>
+<project xmlns="http://maven.apache.org/POM/4.0.0" xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" xsi:schemaLocation="http://maven.apache.org/POM/4.0.0 http://maven.apache.org/xsd/maven-4.0.0.xsd">
+  <modelVersion>4.0.0</modelVersion>
+  <groupId>com.oracle.truffle</groupId>
+  <artifactId>truffle-maven-install</artifactId>
+  <version>1</version>
+  <packaging>pom</packaging>
+  <build>
+    <plugins>
+      <plugin>
+        <groupId>org.apache.maven.plugins</groupId>
+        <artifactId>maven-install-plugin</artifactId>
+        <executions>
+"""
+
+_MAVEN_POM_EXECUTION = """          <execution>
+            <id>install-%(artifactId)s</id>
+            <phase>install</phase>
+            <goals><goal>install-file</goal></goals>
+            <configuration>
+              <file>%(path)s</file>
+              <groupId>%(groupId)s</groupId>
+              <artifactId>%(artifactId)s</artifactId>
+              <version>%(version)s</version>
+              <packaging>jar</packaging>
+            </configuration>
+          </execution>
+"""
+
+_MAVEN_POM_FOOTER = """        </executions>
+      </plugin>
+    </plugins>
+  </build>
+</project>
+"""
+
+def maven_install_truffle(args):
+    """install Truffle into your local Maven repository"""
+    version = _suite.release_version(snapshotSuffix='SNAPSHOT')
+    artifacts = []
+    for dist in _suite.dists:
+        if getattr(dist, 'isProcessorDistribution', False):
+            continue
+        mx.archive(['@' + dist.name])
+        path = dist.path
+        artifactId = splitext(basename(path))[0].lower().replace('_', '-')
+        artifacts.append({'groupId' : 'com.oracle.' + dist.suite.name, 'artifactId' : artifactId, 'version' : version, 'path' : path})
+    # Install all artifacts with a single mvn process instead of paying
+    # JVM startup once per distribution: bind one install-file execution
+    # per artifact in a throw-away aggregator POM and run its install phase.
+    tmpDir = tempfile.mkdtemp(prefix='truffle-maven-install')
+    try:
+        pom = join(tmpDir, 'pom.xml')
+        with open(pom, 'w') as fp:
+            fp.write(_MAVEN_POM_HEADER)
+            for artifact in artifacts:
+                fp.write(_MAVEN_POM_EXECUTION % artifact)
+            fp.write(_MAVEN_POM_FOOTER)
+        mx.run(['mvn', '-f', pom, '-N', 'install'])
+    finally:
+        shutil.rmtree(tmpDir)
 
 def _truffle_gate_runner(args, tasks):
     with Task('Truffle UnitTests', tasks) as t:
@@ -67,4 +144,5 @@ mx.update_commands(_suite, {
     'sl' : [sl, '[SL args|@VM options]'],
     'sldebug' : [sldebug, '[SL args|@VM options]'],
     'slcoverage' : [slcoverage, '[SL args|@VM options]'],
+    'maven-install-truffle' : [maven_install_truffle, ''],
 })